@@ -1,14 +1,19 @@
 """Shared utilities for building inputs and interacting with a FourCastNet NIM."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import contextlib
+import os
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import AsyncIterator, Iterable, Optional
 
+import aiohttp
 import numpy as np
 import requests
 from requests import RequestException
+from requests_toolbelt import MultipartEncoder
 
 from earth2studio.data import ARCO
 from earth2studio.models.px.sfno import VARIABLES
@@ -16,6 +21,7 @@ from earth2studio.models.px.sfno import VARIABLES
 # FourCastNet expects 73 channels that match the VARIABLES ordering from earth2studio
 CHANNELS: Iterable[str] = tuple(VARIABLES)
 DEFAULT_INPUT_TIME = datetime(2023, 1, 1, tzinfo=timezone.utc)
+ARCO_CACHE_DIR_ENV = "EARTH2_ARCO_CACHE_DIR"
 
 
 def _normalize_time(value: datetime) -> datetime:
@@ -26,11 +32,19 @@ def _normalize_time(value: datetime) -> datetime:
     return value.astimezone(timezone.utc).replace(tzinfo=None)
 
 
-def generate_input_array(input_time: datetime = DEFAULT_INPUT_TIME) -> np.ndarray:
-    """Return a 73×721×1440 array wrapped in a batch dimension expected by the NIM."""
+def arco_cache_dir() -> Path:
+    """Directory for cached ARCO inputs (override with ``EARTH2_ARCO_CACHE_DIR``)."""
+    return Path(os.environ.get(ARCO_CACHE_DIR_ENV, "~/.cache/earth2")).expanduser()
+
+
+def _fetch_arco_array(input_time: datetime) -> np.ndarray:
+    """Download the (variable, lat, lon) analysis for ``input_time`` from ARCO."""
     ds = ARCO()
     da = ds(time=_normalize_time(input_time), variable=VARIABLES)
-    array = da.to_numpy().astype("float32", copy=False)
+    array = da.to_numpy()
+    if array.dtype != np.float32:
+        # ARCO fills a float64 buffer; convert once, and only when needed
+        array = array.astype(np.float32)
     if array.ndim == 4 and array.shape[0] == 1:
         # ARCO occasionally preserves a singleton time dimension even when a
         # specific timestamp is requested.  Drop it so the downstream tooling
@@ -41,7 +55,35 @@ def generate_input_array(input_time: datetime = DEFAULT_INPUT_TIME) -> np.ndarra
         raise ValueError(
             f"Expected a (variable, lat, lon) array from ARCO; received shape {array.shape}."
         )
-    return array[None]
+    return array
+
+
+def generate_input_array(input_time: datetime = DEFAULT_INPUT_TIME) -> np.ndarray:
+    """
+    Return a 73×721×1440 array wrapped in a batch dimension expected by the NIM.
+
+    The ARCO download is cached under :func:`arco_cache_dir`, keyed by the
+    analysis time, so later calls for the same time read the local copy.
+    """
+    cache_path = arco_cache_dir() / f"arco_{_normalize_time(input_time):%Y%m%dT%H%M%S}.npy"
+    if cache_path.exists():
+        return np.expand_dims(np.load(cache_path, mmap_mode="r"), 0)
+
+    array = _fetch_arco_array(input_time)
+    # write then rename so concurrent or interrupted runs never see a partial file
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as f_out:
+            np.save(f_out, array)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # read-only or missing cache directory: the cache is only an optimization
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return np.expand_dims(array, 0)
 
 
 def write_input_array(output_path: Path | str, input_time: datetime = DEFAULT_INPUT_TIME) -> Path:
@@ -58,6 +100,13 @@ class NimConfig:
 
     base_url: str = "http://localhost:8000"
     api_key: Optional[str] = None
+    _session: Optional[requests.Session] = field(default=None, init=False, repr=False, compare=False)
+    _async_session: Optional[aiohttp.ClientSession] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _async_loop: Optional[asyncio.AbstractEventLoop] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def headers(self) -> dict[str, str]:
         headers = {"accept": "application/json"}
@@ -65,12 +114,80 @@ class NimConfig:
             headers["Authorization"] = f"Bearer {self.api_key}"
         return headers
 
+    @property
+    def session(self) -> requests.Session:
+        """
+        Pooled HTTP session shared by every call made with this config.
+
+        Created on first use with :meth:`headers` applied once, so the health
+        probe and the forecast request reuse the same keep-alive connection.
+        """
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update(self.headers())
+        return self._session
+
+    @property
+    def async_session(self) -> aiohttp.ClientSession:
+        """
+        Pooled ``aiohttp`` session used by the ``*_async`` helpers.
+
+        Created on first use, which must happen inside a running event loop,
+        and rebuilt when used from a different loop (e.g. a second
+        ``asyncio.run``); release it with :meth:`aclose` or ``async with config:``.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._async_loop is not loop:
+            self._async_session = aiohttp.ClientSession(headers=self.headers())
+            self._async_loop = loop
+        return self._async_session
+
+    @contextlib.asynccontextmanager
+    async def _async_session_scope(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Session for one ``*_async`` call: the pooled :attr:`async_session` when
+        it is open on the running loop (inside ``async with config:``),
+        otherwise a private session that is closed on exit.
+        """
+        session = self._async_session
+        if session is not None and not session.closed and self._async_loop is asyncio.get_running_loop():
+            yield session
+        else:
+            async with aiohttp.ClientSession(headers=self.headers()) as session:
+                yield session
+
+    def close(self) -> None:
+        """Close the pooled session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def aclose(self) -> None:
+        """Close the pooled ``aiohttp`` session, if one was opened."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+            self._async_loop = None
+
+    def __enter__(self) -> NimConfig:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> NimConfig:
+        self.async_session  # open the pooled session for the calls in this block
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
 
 class NimConnectionError(RuntimeError):
     """Raised when the FourCastNet NIM cannot be reached."""
 
 
-def _raise_connection_error(base_url: str, exc: RequestException) -> None:
+def _raise_connection_error(base_url: str, exc: Exception) -> None:
     """Raise a helpful error when the NIM cannot be reached."""
 
     message = (
@@ -85,12 +202,17 @@ def health_ready(config: NimConfig) -> None:
     """Raise ``RuntimeError`` if the NIM is not reachable or not ready."""
     url = f"{config.base_url.rstrip('/')}/v1/health/ready"
     try:
-        resp = requests.get(url, headers=config.headers(), timeout=30)
+        resp = config.session.get(url, timeout=30)
         resp.raise_for_status()
     except RequestException as exc:  # pragma: no cover - network failures are environment-dependent
         _raise_connection_error(config.base_url, exc)
 
 
+def _format_input_time(input_time: datetime) -> str:
+    """Render ``input_time`` as the ``...Z`` ISO-8601 string the NIM expects."""
+    return input_time.replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 def run_inference(
     *,
     config: NimConfig,
@@ -118,19 +240,118 @@ def run_inference(
     health_ready(config)
 
     url = f"{config.base_url.rstrip('/')}/v1/infer"
-    payload = {
-        "input_time": (None, input_time.replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")),
-        "simulation_length": (None, str(simulation_length)),
-    }
+    output_path = Path(output_tar)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = output_path.with_name(f"{output_path.name}.part")
     try:
         with Path(input_path).open("rb") as f_in:
-            files = {"input_array": f_in, **payload}
-            resp = requests.post(url, headers=config.headers(), files=files, timeout=300)
-            resp.raise_for_status()
+            # stream the ~300 MB input from disk to the socket instead of
+            # letting ``requests`` build the whole multipart body in memory
+            form = MultipartEncoder(
+                fields={
+                    "input_array": (Path(input_path).name, f_in, "application/octet-stream"),
+                    "input_time": _format_input_time(input_time),
+                    "simulation_length": str(simulation_length),
+                }
+            )
+            headers = {"Content-Type": form.content_type}
+            # stream the archive to disk in chunks rather than holding the
+            # whole TAR in memory via ``resp.content``
+            with config.session.post(
+                url, data=form, headers=headers, timeout=300, stream=True
+            ) as resp:
+                resp.raise_for_status()
+                with part_path.open("wb") as f_out:
+                    for chunk in resp.iter_content(chunk_size=1 << 20):
+                        f_out.write(chunk)
     except RequestException as exc:  # pragma: no cover - network failures are environment-dependent
+        part_path.unlink(missing_ok=True)
         _raise_connection_error(config.base_url, exc)
 
+    part_path.replace(output_path)
+    return output_path
+
+
+async def _health_ready_on(session: aiohttp.ClientSession, config: NimConfig) -> None:
+    """Probe the ready endpoint with an already open ``session``."""
+    url = f"{config.base_url.rstrip('/')}/v1/health/ready"
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+            resp.raise_for_status()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:  # pragma: no cover - network failures are environment-dependent
+        _raise_connection_error(config.base_url, exc)
+
+
+async def health_ready_async(config: NimConfig) -> None:
+    """Async variant of :func:`health_ready` (pooled inside ``async with config:``)."""
+    async with config._async_session_scope() as session:
+        await _health_ready_on(session, config)
+
+
+async def run_inference_async(
+    *,
+    config: NimConfig,
+    input_path: Path | str,
+    input_time: datetime,
+    simulation_length: int,
+    output_tar: Path | str,
+) -> Path:
+    """
+    Async variant of :func:`run_inference`; takes the same parameters.
+
+    The health probe, multipart upload and chunked TAR download share one
+    ``aiohttp`` session (``config.async_session`` inside ``async with config:``,
+    otherwise one opened and closed for this call), so the caller's event loop
+    stays free for other work while the (multi-minute) forecast runs.
+    """
+    async with config._async_session_scope() as session:
+        await _health_ready_on(session, config)
+        return await _infer_on(
+            session,
+            config=config,
+            input_path=input_path,
+            input_time=input_time,
+            simulation_length=simulation_length,
+            output_tar=output_tar,
+        )
+
+
+async def _infer_on(
+    session: aiohttp.ClientSession,
+    *,
+    config: NimConfig,
+    input_path: Path | str,
+    input_time: datetime,
+    simulation_length: int,
+    output_tar: Path | str,
+) -> Path:
+    """Upload the input and stream the TAR response to disk over ``session``."""
+    url = f"{config.base_url.rstrip('/')}/v1/infer"
     output_path = Path(output_tar)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_bytes(resp.content)
+    part_path = output_path.with_name(f"{output_path.name}.part")
+    try:
+        with Path(input_path).open("rb") as f_in:
+            form = aiohttp.FormData()
+            form.add_field(
+                "input_array",
+                f_in,
+                filename=Path(input_path).name,
+                content_type="application/octet-stream",
+            )
+            form.add_field("input_time", _format_input_time(input_time))
+            form.add_field("simulation_length", str(simulation_length))
+            # per-connect/per-read limits like the blocking ``timeout=300``;
+            # no cap on the whole upload + inference + download
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=300, sock_read=300)
+            async with session.post(url, data=form, timeout=timeout) as resp:
+                resp.raise_for_status()
+                with part_path.open("wb") as f_out:
+                    async for chunk in resp.content.iter_chunked(1 << 20):
+                        f_out.write(chunk)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:  # pragma: no cover - network failures are environment-dependent
+        part_path.unlink(missing_ok=True)
+        _raise_connection_error(config.base_url, exc)
+
+    part_path.replace(output_path)
     return output_path
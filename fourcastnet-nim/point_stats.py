@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
+import functools
 import glob
+import hashlib
+import os
 import numpy as np
 import xarray as xr
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 
 from fcn_client import CHANNELS
 
 # ---- CONFIG you can change ----
 INPUT_TIME_ISO = "2023-01-01T00:00:00Z"   # must match what you used in the /v1/infer call
 STEP_HOURS = 6                             # FourCastNet NIM uses 6h steps by default
+STACK_CACHE = True                         # reuse the assembled stack across runs (.fcn_stack_*.npy)
 # --------------------------------
 
 def _grid_lat_lon():
@@ -19,98 +25,245 @@ def _grid_lat_lon():
     lon = np.linspace(0.0, 360.0 - 360.0/1440, 1440, dtype=np.float32)
     return lat, lon
 
-def _load_dataset() -> xr.Dataset:
-    """Load all forecast steps into an xarray Dataset, normalizing shapes."""
+# the grid never changes, so build the coordinate arrays once
+_LAT, _LON = _grid_lat_lon()
+
+# variables extracted for every point query, in output order
+POINT_VARS = ("t2m", "tcwv", "u10m", "v10m", "msl")
+# their channels in the 73-channel step files; the stack keeps only these
+_POINT_CHANNELS = tuple(list(CHANNELS).index(name) for name in POINT_VARS)
+
+@dataclass(slots=True)
+class ForecastCube:
+    """Forecast stack and coordinates as plain NumPy arrays (no xarray on the query path)."""
+
+    cube: np.ndarray                # (T, V, H, W) float32
+    times: np.ndarray               # (T,) datetime64[s]
+    variables: Tuple[str, ...]
+    lat: np.ndarray
+    lon: np.ndarray
+    var_index: dict = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # name -> channel index, so queries skip searching the coordinate
+        self.var_index = {name: i for i, name in enumerate(self.variables)}
+
+    @classmethod
+    def from_dataset(cls, ds: xr.Dataset) -> "ForecastCube":
+        """Wrap a Dataset with an `fcn` (time, variable, lat, lon) variable, without copying."""
+        return cls(
+            cube=ds["fcn"].transpose("time", "variable", "lat", "lon").values,
+            times=ds["time"].values.astype("datetime64[s]"),
+            variables=tuple(str(v) for v in ds["variable"].values),
+            lat=ds["lat"].values,
+            lon=ds["lon"].values,
+        )
+
+    def to_dataset(self) -> xr.Dataset:
+        """Labelled xarray view of the same data."""
+        return xr.Dataset(
+            {"fcn": (("time", "variable", "lat", "lon"), self.cube)},
+            coords={"time": self.times, "variable": list(self.variables),
+                    "lat": self.lat, "lon": self.lon},
+            attrs={"description": "FourCastNet forecast"}
+        )
+
+def _load_step(p: str) -> np.ndarray:
+    """Memory-map one forecast step file and normalize it to a (73, 721, 1440) view."""
+    arr = np.load(p, mmap_mode="r")  # could be (73,721,1440) or have leading singletons
+
+    # squeeze leading singleton dims (batch, time, etc.)
+    while arr.ndim > 3 and arr.shape[0] == 1:
+        arr = np.squeeze(arr, axis=0)
+
+    # drop any leftover singleton if 4D
+    if arr.ndim == 4 and 1 in arr.shape:
+        arr = np.squeeze(arr)
+
+    if arr.ndim != 3:
+        raise ValueError(f"Unexpected array shape {arr.shape} in {p}; expected 3D after squeeze.")
+
+    if 73 not in arr.shape:
+        raise ValueError(f"'73' (num variables) not found in shape {arr.shape} for {p}.")
+    if arr.shape[0] != 73:
+        ch_axis = list(arr.shape).index(73)
+        arr = np.moveaxis(arr, ch_axis, 0)  # (73, H, W)
+
+    if arr.shape[1:] != (721, 1440):
+        raise ValueError(f"Spatial shape mismatch {arr.shape[1:]} in {p}; expected (721,1440).")
+    return arr
+
+def _assemble_stack(steps: list) -> np.ndarray:
+    """Read the POINT_VARS channels of every step file into one (T,5,721,1440) float32 array."""
+    # fill a preallocated stack straight from memory-mapped files; only the
+    # 5 channels the queries use are read (~20 MB of each ~300 MB step)
+    stack = np.empty((len(steps), len(POINT_VARS), 721, 1440), dtype=np.float32)
+
+    def _load_one(idx_p):
+        i, p = idx_p
+        arr = _load_step(p)
+        for k, ch in enumerate(_POINT_CHANNELS):
+            np.copyto(stack[i, k], arr[ch])
+
+    # steps are independent and each thread writes a disjoint slab, so the
+    # (I/O-bound) reads can overlap without locking
+    with ThreadPoolExecutor(max_workers=min(8, len(steps))) as ex:
+        list(ex.map(_load_one, enumerate(steps)))
+    return stack
+
+def _stack_cache_path(files: tuple) -> str:
+    """Cache file name for the assembled stack, keyed by step (name, size, mtime) tuples and channels."""
+    h = hashlib.sha1(",".join(POINT_VARS).encode())
+    for p, size, mtime_ns in files:
+        h.update(f"{p}:{size}:{mtime_ns};".encode())
+    return f".fcn_stack_{h.hexdigest()[:16]}.npy"
+
+def _load_stack(files: tuple) -> np.ndarray:
+    """
+    Assembled forecast stack, reused from a single cached .npy next to the
+    step files when they are unchanged (memory-mapped, one sequential file
+    instead of T opens + normalization).
+    """
+    steps = [p for p, _, _ in files]
+    if not STACK_CACHE:
+        return _assemble_stack(steps)
+
+    cache = _stack_cache_path(files)
+    if os.path.exists(cache):
+        stack = np.load(cache, mmap_mode="r")
+        if stack.shape == (len(steps), len(POINT_VARS), 721, 1440):
+            return stack
+
+    stack = _assemble_stack(steps)
+    try:
+        for old in glob.glob(".fcn_stack_*.npy"):  # stacks of older step files
+            os.remove(old)
+        tmp = f"{cache}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, stack)
+        os.replace(tmp, cache)
+    except OSError:
+        pass  # read-only or full directory: the cache is only an optimization
+    return stack
+
+def _load_dataset() -> ForecastCube:
+    """
+    Load all forecast steps into a ForecastCube, normalizing shapes.
+    Repeated calls in one process return the same (shared, read-only) cube
+    while the step files and the time config are unchanged.
+    """
     steps = sorted(glob.glob("[0-9][0-9][0-9]_[0-9][0-9][0-9].npy"))
     if not steps:
         raise FileNotFoundError("No forecast step files like 000_000.npy found here.")
 
+    stats = [os.stat(p) for p in steps]
+    files = tuple((p, st.st_size, st.st_mtime_ns) for p, st in zip(steps, stats))
+    return _load_forecast(os.getcwd(), files, INPUT_TIME_ISO, STEP_HOURS)
+
+@functools.lru_cache(maxsize=1)
+def _load_forecast(cwd: str, files: tuple, input_time_iso: str, step_hours: int) -> ForecastCube:
+    """Build the cube for one set of step files; keyed so edits or a new directory reload."""
     # Build time coordinates (as numpy datetime64[s] without tz parsing warnings)
-    t0 = datetime.fromisoformat(INPUT_TIME_ISO.replace("Z", "+00:00"))
-    times_py = [t0 + timedelta(hours=STEP_HOURS * i) for i in range(len(steps))]
+    t0 = datetime.fromisoformat(input_time_iso.replace("Z", "+00:00"))
+    times_py = [t0 + timedelta(hours=step_hours * i) for i in range(len(files))]
     times = np.array([np.datetime64(int(t.timestamp()), "s") for t in times_py])
 
-    lat, lon = _grid_lat_lon()
-
-    norm_arrays = []
-    for p in steps:
-        arr = np.load(p)  # could be (73,721,1440) or have leading singletons
-        arr = np.asarray(arr, dtype=np.float32)
-
-        # squeeze leading singleton dims (batch, time, etc.)
-        while arr.ndim > 3 and arr.shape[0] == 1:
-            arr = np.squeeze(arr, axis=0)
-
-        # drop any leftover singleton if 4D
-        if arr.ndim == 4 and 1 in arr.shape:
-            arr = np.squeeze(arr)
-
-        if arr.ndim != 3:
-            raise ValueError(f"Unexpected array shape {arr.shape} in {p}; expected 3D after squeeze.")
-
-        if 73 not in arr.shape:
-            raise ValueError(f"'73' (num variables) not found in shape {arr.shape} for {p}.")
-        if arr.shape[0] != 73:
-            ch_axis = list(arr.shape).index(73)
-            arr = np.moveaxis(arr, ch_axis, 0)  # (73, H, W)
-
-        if arr.shape[1:] != (721, 1440):
-            raise ValueError(f"Spatial shape mismatch {arr.shape[1:]} in {p}; expected (721,1440).")
+    stack = _load_stack(files)
+    stack.flags.writeable = False  # shared by every caller of the cached result
+    return ForecastCube(cube=stack, times=times, variables=POINT_VARS, lat=_LAT, lon=_LON)
 
-        norm_arrays.append(arr[np.newaxis, ...])  # (1,73,721,1440)
-
-    stack = np.concatenate(norm_arrays, axis=0)  # (T,73,721,1440)
-
-    ds = xr.Dataset(
-        {"fcn": (("time", "variable", "lat", "lon"), stack)},
-        coords={"time": times, "variable": CHANNELS, "lat": lat, "lon": lon},
-        attrs={"description": "FourCastNet forecast"}
-    )
+def _as_cube(ds: Optional[Union[ForecastCube, xr.Dataset]]) -> ForecastCube:
+    """Load the forecast if needed; accept a legacy xr.Dataset as well as a ForecastCube."""
+    if ds is None:
+        return _load_dataset()
+    if isinstance(ds, xr.Dataset):
+        return ForecastCube.from_dataset(ds)
     return ds
 
+def _var_indices(fc: ForecastCube, names=POINT_VARS) -> list:
+    """Channel indices of `names` from the cube's cached name -> index map."""
+    for name in names:
+        if name not in fc.var_index:
+            raise KeyError(f"Variable '{name}' not found.")
+    return [fc.var_index[name] for name in names]
+
 def _wrap_lon_east(lon_deg: float) -> float:
     """Convert [-180,180] to [0,360)."""
     return lon_deg % 360.0
 
-def _bilinear_on_regular_grid(field2d: np.ndarray, lat: np.ndarray, lon: np.ndarray,
-                              lat_q: float, lon_q: float) -> float:
+def _grid_position(lat: np.ndarray, lon: np.ndarray,
+                   lat_q, lon_q) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Bilinear interpolation on a regular (lat descending, lon ascending) grid.
-    field2d: (lat, lon)
+    Fractional (row, col) of query point(s) on a regular (lat descending,
+    lon ascending) grid, computed from the first cell and the spacing
+    instead of searching the coordinate arrays. `lat_q`/`lon_q` may be
+    scalars or arrays of the same shape.
     """
-    # indices around the query point
-    lat_idx = np.searchsorted(lat[::-1], lat_q, side="left")
-    lat0 = len(lat) - 1 - np.clip(lat_idx, 1, len(lat) - 1)
-    lat1 = np.clip(lat0 + 1, 0, len(lat) - 1)
+    dlat = float(lat[0] - lat[1])
+    dlon = float(lon[1] - lon[0])
+    fi = (float(lat[0]) - np.asarray(lat_q, dtype=np.float64)) / dlat
+    fj = _wrap_lon_east(np.asarray(lon_q, dtype=np.float64) - float(lon[0])) / dlon
+    return fi, fj
 
-    lon_q = _wrap_lon_east(lon_q)
-    j = np.searchsorted(lon, lon_q, side="right") - 1
+def _bilinear_indices(lat: np.ndarray, lon: np.ndarray, lat_q, lon_q) -> Tuple[np.ndarray, ...]:
+    """
+    Corner indices and weights for bilinear interpolation on a regular
+    (lat descending, lon ascending) grid: (lat0, lat1, lon0, lon1, wy, wx),
+    each shaped like the query point(s).
+    """
+    fi, fj = _grid_position(lat, lon, lat_q, lon_q)
+
+    # indices around the query point (north row, wrapping east column)
+    lat0 = np.clip(np.floor(fi).astype(np.intp), 0, len(lat) - 2)
+    lat1 = lat0 + 1
+    j = np.floor(fj).astype(np.intp)
     lon0 = j % len(lon)
     lon1 = (j + 1) % len(lon)
 
     # weights
-    y0, y1 = lat[lat0], lat[lat1]
-    x0, x1 = lon[lon0], lon[lon1]
-    wy = 0.0 if y0 == y1 else (y0 - lat_q) / (y0 - y1)  # latitude axis decreases
-    wx = 0.0 if x0 == x1 else (lon_q - x0) / ((x1 - x0) if x1 > x0 else ((x1 + 360) - x0))
-
-    # neighbor values
-    f00 = field2d[lat0, lon0]
-    f01 = field2d[lat0, lon1]
-    f10 = field2d[lat1, lon0]
-    f11 = field2d[lat1, lon1]
-
-    return (1 - wy) * ((1 - wx) * f00 + wx * f01) + wy * ((1 - wx) * f10 + wx * f11)
-
-def _local_stats_3x3(field2d: np.ndarray, lat: np.ndarray, lon: np.ndarray,
-                     lat_q: float, lon_q: float) -> Tuple[float, float, float]:
-    """Mean/min/max over a 3×3 neighborhood around nearest grid cell (fast context)."""
-    i = np.argmin(np.abs(lat - lat_q))
-    j = np.argmin(np.abs((lon - _wrap_lon_east(lon_q) + 180) % 360 - 180))
-    ii = np.clip(np.array([i - 1, i, i + 1]), 0, len(lat) - 1)
-    jj = (np.array([j - 1, j, j + 1]) % len(lon))
-    block = field2d[np.ix_(ii, jj)]
-    return float(block.mean()), float(block.min()), float(block.max())
+    wy = fi - lat0  # latitude axis decreases
+    wx = fj - j
+    return lat0, lat1, lon0, lon1, wy, wx
+
+def _bilinear_gather(cube: np.ndarray, t_idx, vidxs, lat: np.ndarray, lon: np.ndarray,
+                     lat_q, lon_q) -> np.ndarray:
+    """
+    Bilinear point values for the given steps and variables of a (T, V, H, W)
+    cube: a single fancy-index gather of the four corners, shape
+    (len(t_idx), len(vidxs)) for one point or (P, len(t_idx), len(vidxs))
+    for P points.
+    """
+    lat0, lat1, lon0, lon1, wy, wx = _bilinear_indices(lat, lon, lat_q, lon_q)
+    lat4 = np.stack([lat0, lat0, lat1, lat1], axis=-1)  # (..., 4)
+    lon4 = np.stack([lon0, lon1, lon0, lon1], axis=-1)
+    weights = np.stack([(1 - wy) * (1 - wx), (1 - wy) * wx, wy * (1 - wx), wy * wx], axis=-1)
+    corners = cube[np.asarray(t_idx)[:, None, None], np.asarray(vidxs)[None, :, None],
+                   lat4[..., None, None, :], lon4[..., None, None, :]]  # (..., T, K, 4)
+    return np.einsum("...tkc,...c->...tk", corners, weights)
+
+def _neighbor_indices_3x3(lat: np.ndarray, lon: np.ndarray,
+                          lat_q, lon_q) -> Tuple[np.ndarray, np.ndarray]:
+    """Row/column indices (..., 3) of the 3×3 neighborhood around the nearest grid cell(s)."""
+    fi, fj = _grid_position(lat, lon, lat_q, lon_q)
+    # round half-cell ties down to the lower index, as argmin over the
+    # coordinates did; the wrap tie between the last column and 0 goes to 0
+    i = np.clip(np.ceil(fi - 0.5).astype(np.intp), 0, len(lat) - 1)
+    j = np.where(fj == len(lon) - 0.5, 0, np.ceil(fj - 0.5).astype(np.intp))
+    offs = np.array([-1, 0, 1])
+    ii = np.clip(np.expand_dims(i, -1) + offs, 0, len(lat) - 1)
+    jj = (np.expand_dims(j, -1) + offs) % len(lon)
+    return ii, jj
+
+def _neighbor_gather(cube: np.ndarray, t_idx, vidxs, lat: np.ndarray, lon: np.ndarray,
+                     lat_q, lon_q) -> np.ndarray:
+    """
+    The 3×3 window around the nearest cell for the given steps and
+    variables: (len(t_idx), len(vidxs), 3, 3) for one point or
+    (P, len(t_idx), len(vidxs), 3, 3) for P points.
+    """
+    ii, jj = _neighbor_indices_3x3(lat, lon, lat_q, lon_q)
+    return cube[np.asarray(t_idx)[:, None, None, None], np.asarray(vidxs)[None, :, None, None],
+                ii[..., None, None, :, None], jj[..., None, None, None, :]]
 
 def _time_indices_for_linear(times: np.ndarray, when: np.datetime64) -> Tuple[int, int, float]:
     """
@@ -131,105 +284,126 @@ def _time_indices_for_linear(times: np.ndarray, when: np.datetime64) -> Tuple[in
     alpha = 0.0 if t1 == t0 else (tw - t0) / (t1 - t0)
     return i0, i1, float(alpha)
 
-def _row_from_time_index(ds: xr.Dataset, t_idx: int, lat_q: float, lon_q: float,
-                         want_context: bool, cache_vars=None) -> dict:
+def _row_from_time_index(fc: ForecastCube, t_idx: int, lat_q: float, lon_q: float,
+                         want_context: bool) -> dict:
     """Compute a row (no time interpolation): interpolate space at a single time index."""
-    if cache_vars is None:
-        cache_vars = {}
-    varnames = ds["variable"].values
-
-    def vidx(name: str) -> int:
-        key = f"vidx:{name}"
-        if key in cache_vars:
-            return cache_vars[key]
-        idx = np.where(varnames == name)[0]
-        if len(idx) == 0:
-            raise KeyError(f"Variable '{name}' not found.")
-        cache_vars[key] = int(idx[0])
-        return cache_vars[key]
-
-    i_t2m  = vidx("t2m")
-    i_tcwv = vidx("tcwv")
-    i_u10m = vidx("u10m")
-    i_v10m = vidx("v10m")
-    i_msl  = vidx("msl")
-
-    lat = ds["lat"].values
-    lon = ds["lon"].values
-
-    F = ds["fcn"].isel(time=t_idx)
-    # point interpolations
-    t2mK  = _bilinear_on_regular_grid(F.isel(variable=i_t2m).values,  lat, lon, lat_q, lon_q)
-    tcwv  = _bilinear_on_regular_grid(F.isel(variable=i_tcwv).values, lat, lon, lat_q, lon_q)
-    u10   = _bilinear_on_regular_grid(F.isel(variable=i_u10m).values, lat, lon, lat_q, lon_q)
-    v10   = _bilinear_on_regular_grid(F.isel(variable=i_v10m).values, lat, lon, lat_q, lon_q)
-    mslPa = _bilinear_on_regular_grid(F.isel(variable=i_msl).values,  lat, lon, lat_q, lon_q)
-
-    ws10 = float(np.hypot(u10, v10))
-    msl_hPa = float(mslPa / 100.0)
-
-    t_iso = np.datetime_as_string(ds["time"].values[t_idx], unit="s")
-
-    rec = {
-        "time": t_iso,
-        "t2m_C": float(t2mK - 273.15),
-        "tcwv_kg_m2": float(tcwv),
-        "ws10m_m_s": ws10,
-        "msl_hPa": msl_hPa,
+    vidxs = _var_indices(fc)
+    steps = [t_idx]
+
+    # the point_timeseries row for this step: same gathers and reductions
+    vals = _bilinear_gather(fc.cube, steps, vidxs, fc.lat, fc.lon, lat_q, lon_q)
+    block = _neighbor_gather(fc.cube, steps, vidxs, fc.lat, fc.lon, lat_q, lon_q) if want_context else None
+    cols = _series_columns(fc.times[steps], vals, block)
+    return {name: col[0].item() for name, col in cols.items()}
+
+def _series_columns(times: np.ndarray, vals: np.ndarray,
+                    block: Optional[np.ndarray]) -> dict:
+    """
+    Output columns of a point time series from the bilinear point values
+    `vals` (T, 5) and, if given, the 3×3 neighborhood `block` (T, 5, 3, 3),
+    both in POINT_VARS order.
+    """
+    t2mK, tcwv, u10, v10, mslPa = vals.T
+
+    cols = {
+        "time": np.datetime_as_string(times, unit="s"),
+        "t2m_C": t2mK - 273.15,
+        "tcwv_kg_m2": tcwv,
+        "ws10m_m_s": np.hypot(u10, v10),
+        "msl_hPa": mslPa / 100.0,
     }
 
-    if want_context:
-        # Neighborhood stats (fast, nearest-step only)
-        meanC,  minC,  maxC  = _local_stats_3x3(F.isel(variable=i_t2m).values,  lat, lon, lat_q, lon_q)
-        meanWV, minWV, maxWV = _local_stats_3x3(F.isel(variable=i_tcwv).values, lat, lon, lat_q, lon_q)
-        ufield = F.isel(variable=i_u10m).values
-        vfield = F.isel(variable=i_v10m).values
-        wsfield = np.hypot(ufield, vfield)
-        meanWS, minWS, maxWS = _local_stats_3x3(wsfield, lat, lon, lat_q, lon_q)
-        meanMSL, minMSL, maxMSL = _local_stats_3x3(F.isel(variable=i_msl).values, lat, lon, lat_q, lon_q)
-
-        rec.update({
+    if block is not None:
+        # wind speed from the 9 gathered cells only
+        fields = np.stack(
+            [block[:, 0], block[:, 1], np.hypot(block[:, 2], block[:, 3]), block[:, 4]], axis=1
+        ).astype(np.float64)  # (T, 4, 3, 3)
+        means = fields.mean(axis=(-2, -1))
+        mins = fields.min(axis=(-2, -1))
+        maxs = fields.max(axis=(-2, -1))
+        meanC, meanWV, meanWS, meanMSL = means.T
+        minC, minWV, minWS, minMSL = mins.T
+        maxC, maxWV, maxWS, maxMSL = maxs.T
+
+        cols.update({
             "t2m_C_neigh_mean":  meanC - 273.15,
             "t2m_C_neigh_min":   minC - 273.15,
             "t2m_C_neigh_max":   maxC - 273.15,
             "tcwv_neigh_mean":   meanWV,
             "tcwv_neigh_min":    minWV,
             "tcwv_neigh_max":    maxWV,
-            "ws10m_neigh_mean":  float(meanWS),
-            "ws10m_neigh_min":   float(minWS),
-            "ws10m_neigh_max":   float(maxWS),
-            "msl_hPa_neigh_mean": float(meanMSL / 100.0),
-            "msl_hPa_neigh_min":  float(minMSL / 100.0),
-            "msl_hPa_neigh_max":  float(maxMSL / 100.0),
+            "ws10m_neigh_mean":  meanWS,
+            "ws10m_neigh_min":   minWS,
+            "ws10m_neigh_max":   maxWS,
+            "msl_hPa_neigh_mean": meanMSL / 100.0,
+            "msl_hPa_neigh_min":  minMSL / 100.0,
+            "msl_hPa_neigh_max":  maxMSL / 100.0,
         })
 
-    return rec
+    return cols
 
 def point_timeseries(lat_q: float, lon_q: float,
                      want_context: bool = True,
-                     ds: Optional[xr.Dataset] = None) -> pd.DataFrame:
+                     ds: Optional[Union[ForecastCube, xr.Dataset]] = None) -> pd.DataFrame:
     """Full time series (all available steps)."""
-    if ds is None:
-        ds = _load_dataset()
+    fc = _as_cube(ds)
+    vidxs = _var_indices(fc)
+    steps = np.arange(len(fc.times))
+
+    # corner indices/weights are shared by every variable and time step, so
+    # gather the corners for all of them at once -> (T, 5)
+    vals = _bilinear_gather(fc.cube, steps, vidxs, fc.lat, fc.lon, lat_q, lon_q)
 
-    rows = []
-    cache_vars = {}
-    for t_idx in range(ds.sizes["time"]):
-        rows.append(_row_from_time_index(ds, t_idx, lat_q, lon_q, want_context, cache_vars))
-    return pd.DataFrame(rows)
+    # Neighborhood stats: the same 3×3 window for every step and variable -> (T, 5, 3, 3)
+    block = _neighbor_gather(fc.cube, steps, vidxs, fc.lat, fc.lon, lat_q, lon_q) if want_context else None
+
+    return pd.DataFrame(_series_columns(fc.times, vals, block))
+
+def point_timeseries_batch(lats, lons,
+                           want_context: bool = True,
+                           ds: Optional[Union[ForecastCube, xr.Dataset]] = None) -> pd.DataFrame:
+    """
+    Full time series for many points at once: the same rows as
+    `point_timeseries` for each (lat, lon) pair, stacked point after point
+    with leading `lat`/`lon` columns. The forecast is loaded and indexed once
+    and every point's corners (and 3×3 windows) are fetched in one gather.
+    """
+    lats = np.atleast_1d(np.asarray(lats, dtype=np.float64))
+    lons = np.atleast_1d(np.asarray(lons, dtype=np.float64))
+    if lats.shape != lons.shape or lats.ndim != 1:
+        raise ValueError("lats and lons must be 1D sequences of the same length.")
+
+    fc = _as_cube(ds)
+    vidxs = _var_indices(fc)
+    steps = np.arange(len(fc.times))
+
+    vals = _bilinear_gather(fc.cube, steps, vidxs, fc.lat, fc.lon, lats, lons)  # (P, T, 5)
+    blocks = _neighbor_gather(fc.cube, steps, vidxs, fc.lat, fc.lon, lats, lons) if want_context else None
+
+    frames = []
+    for p in range(len(lats)):
+        cols = {"lat": lats[p], "lon": lons[p]}
+        cols.update(_series_columns(fc.times, vals[p], None if blocks is None else blocks[p]))
+        frames.append(pd.DataFrame(cols))
+    if not frames:
+        # no points: the same columns with no rows
+        cols = {"lat": lats, "lon": lons}
+        cols.update(_series_columns(fc.times[:0], vals.reshape(0, len(vidxs)),
+                                    None if blocks is None else blocks.reshape(0, len(vidxs), 3, 3)))
+        return pd.DataFrame(cols)
+    return pd.concat(frames, ignore_index=True)
 
 def point_at_time(lat_q: float, lon_q: float, when_iso: str,
                   interp: str = "nearest",
                   want_context: bool = True,
-                  ds: Optional[xr.Dataset] = None) -> pd.DataFrame:
+                  ds: Optional[Union[ForecastCube, xr.Dataset]] = None) -> pd.DataFrame:
     """
     Single-row result at a requested time.
     - interp='nearest': pick closest step.
     - interp='linear' : linear in time between bracketing steps (u/v blended correctly).
       Context stats are taken from the nearest step.
     """
-    if ds is None:
-        ds = _load_dataset()
+    fc = _as_cube(ds)
 
     # parse when
     if when_iso.endswith("Z"):
@@ -237,11 +411,11 @@ def point_at_time(lat_q: float, lon_q: float, when_iso: str,
     when_dt = datetime.fromisoformat(when_iso)
     when_np = np.datetime64(int(when_dt.timestamp()), "s")
 
-    times = ds["time"].values.astype("datetime64[s]")
+    times = fc.times
 
     if interp == "nearest":
         idx = int(np.argmin(np.abs(times - when_np)))
-        row = _row_from_time_index(ds, idx, lat_q, lon_q, want_context)
+        row = _row_from_time_index(fc, idx, lat_q, lon_q, want_context)
         # annotate which step was chosen
         row["time_requested"] = np.datetime_as_string(when_np, unit="s")
         row["time_interp"] = "nearest"
@@ -251,39 +425,15 @@ def point_at_time(lat_q: float, lon_q: float, when_iso: str,
         i0, i1, alpha = _time_indices_for_linear(times, when_np)
         # if exact match, fall back to nearest
         if i0 == i1:
-            row = _row_from_time_index(ds, i0, lat_q, lon_q, want_context)
+            row = _row_from_time_index(fc, i0, lat_q, lon_q, want_context)
             row["time_requested"] = np.datetime_as_string(when_np, unit="s")
             row["time_interp"] = "exact"
             return pd.DataFrame([row])
 
-        # interpolate scalars in time: do space bilinear at both times, then time-blend
-        varnames = ds["variable"].values
-        def vidx(name: str) -> int:
-            idx = np.where(varnames == name)[0]
-            if len(idx) == 0:
-                raise KeyError(f"Variable '{name}' not found.")
-            return int(idx[0])
-
-        i_t2m, i_tcwv = vidx("t2m"), vidx("tcwv")
-        i_u10m, i_v10m = vidx("u10m"), vidx("v10m")
-        i_msl = vidx("msl")
-
-        lat = ds["lat"].values
-        lon = ds["lon"].values
-
-        F0 = ds["fcn"].isel(time=i0)
-        F1 = ds["fcn"].isel(time=i1)
-
-        def interp_point(var_idx):
-            v0 = _bilinear_on_regular_grid(F0.isel(variable=var_idx).values, lat, lon, lat_q, lon_q)
-            v1 = _bilinear_on_regular_grid(F1.isel(variable=var_idx).values, lat, lon, lat_q, lon_q)
-            return (1.0 - alpha) * v0 + alpha * v1
-
-        t2mK  = interp_point(i_t2m)
-        tcwv  = interp_point(i_tcwv)
-        u10   = interp_point(i_u10m)
-        v10   = interp_point(i_v10m)
-        mslPa = interp_point(i_msl)
+        # interpolate scalars in time: space bilinear at both steps for all
+        # five variables in one gather -> (2, 5), then time-blend
+        v01 = _bilinear_gather(fc.cube, [i0, i1], _var_indices(fc), fc.lat, fc.lon, lat_q, lon_q)
+        t2mK, tcwv, u10, v10, mslPa = (1.0 - alpha) * v01[0] + alpha * v01[1]
 
         ws10 = float(np.hypot(u10, v10))
         msl_hPa = float(mslPa / 100.0)
@@ -304,7 +454,7 @@ def point_at_time(lat_q: float, lon_q: float, when_iso: str,
         if want_context:
             # context from nearest step to 'when'
             nearest_idx = i0 if alpha < 0.5 else i1
-            ctx = _row_from_time_index(ds, nearest_idx, lat_q, lon_q, True)
+            ctx = _row_from_time_index(fc, nearest_idx, lat_q, lon_q, True)
             # copy only neighborhood columns
             for k, v in ctx.items():
                 if k.endswith(("_neigh_mean", "_neigh_min", "_neigh_max")):
@@ -327,14 +477,14 @@ if __name__ == "__main__":
                    help="Time interpolation mode when --when is provided.")
     args = p.parse_args()
 
-    ds = _load_dataset()
+    fc = _load_dataset()
 
     if args.when:
         df = point_at_time(args.lat, args.lon, args.when, interp=args.interp,
-                           want_context=(not args.no_context), ds=ds)
+                           want_context=(not args.no_context), ds=fc)
         df.to_csv(args.csv, index=False)
         print(f"Wrote 1 row ({args.interp}) → {args.csv}")
     else:
-        df = point_timeseries(args.lat, args.lon, want_context=(not args.no_context), ds=ds)
+        df = point_timeseries(args.lat, args.lon, want_context=(not args.no_context), ds=fc)
         df.to_csv(args.csv, index=False)
         print(f"Wrote {len(df)} rows and {len(df.columns)} columns → {args.csv}")
@@ -61,16 +61,16 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    config = NimConfig(base_url=args.base_url, api_key=args.api_key)
     input_time = parse_time(args.input_time)
     try:
-        output = run_inference(
-            config=config,
-            input_path=Path(args.input),
-            input_time=input_time,
-            simulation_length=args.simulation_length,
-            output_tar=Path(args.output),
-        )
+        with NimConfig(base_url=args.base_url, api_key=args.api_key) as config:
+            output = run_inference(
+                config=config,
+                input_path=Path(args.input),
+                input_time=input_time,
+                simulation_length=args.simulation_length,
+                output_tar=Path(args.output),
+            )
     except NimConnectionError as exc:
         print(exc, file=sys.stderr)
         raise SystemExit(1) from None